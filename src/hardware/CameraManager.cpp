@@ -5,9 +5,68 @@
 #include <sstream>
 #include <iomanip>
 #include <algorithm>
+#include <iterator>
 
 namespace SaperaCapturePro {
 
+namespace {
+
+// Lookup tables for ColorConfig -> SapColorConversion settings.
+// Indexed by ColorConfig::bayer_align (0..5)
+constexpr SapColorConversion::Align kBayerAlignTable[] = {
+  SapColorConversion::AlignGBRG,
+  SapColorConversion::AlignBGGR,
+  SapColorConversion::AlignRGGB,
+  SapColorConversion::AlignGRBG,
+  SapColorConversion::AlignRGBG,
+  SapColorConversion::AlignBGRG,
+};
+
+// Indexed by ColorConfig::color_method - 1 (methods are 1..7)
+constexpr SapColorConversion::Method kColorMethodTable[] = {
+  SapColorConversion::Method1,
+  SapColorConversion::Method2,
+  SapColorConversion::Method3,
+  SapColorConversion::Method4,
+  SapColorConversion::Method5,
+  SapColorConversion::Method6,
+  SapColorConversion::Method7,
+};
+
+struct OutputFormatEntry {
+  const char* name;
+  SapFormat format;
+};
+
+constexpr OutputFormatEntry kOutputFormatTable[] = {
+  {"RGB888", SapFormatRGB888},
+  {"RGB8888", SapFormatRGB8888},
+  {"RGB101010", SapFormatRGB101010},
+};
+
+SapColorConversion::Align BayerAlignFromIndex(int index) {
+  if (index < 0 || index >= static_cast<int>(std::size(kBayerAlignTable))) {
+    return SapColorConversion::AlignRGGB;
+  }
+  return kBayerAlignTable[index];
+}
+
+SapColorConversion::Method ColorMethodFromIndex(int method) {
+  if (method < 1 || method > static_cast<int>(std::size(kColorMethodTable))) {
+    return SapColorConversion::Method1;
+  }
+  return kColorMethodTable[method - 1];
+}
+
+SapFormat ColorOutputFormatFromName(const std::string& name) {
+  for (const auto& entry : kOutputFormatTable) {
+    if (name == entry.name) return entry.format;
+  }
+  return SapFormatRGB888;
+}
+
+}  // namespace
+
 CameraManager& CameraManager::GetInstance() {
   static CameraManager instance;
   return instance;
@@ -255,7 +314,7 @@ void CameraManager::DisconnectAllCameras() {
 
   // IMPORTANT: Sapera SDK requires disconnection in reverse order of creation:
   // 1. First disconnect and destroy transfers
-  // 2. Then destroy buffers
+  // 2. Then destroy color converters and buffers
   // 3. Finally destroy acquisition devices
   // This prevents "CorXferDisconnect" errors
 
@@ -286,8 +345,12 @@ void CameraManager::DisconnectAllCameras() {
   }
   connected_transfers_.clear();
 
-  // Step 2: Destroy all buffers
-  Log("[NET] Step 2: Destroying buffers...");
+  // Step 2: Destroy color converters (they reference the buffers)
+  Log("[NET] Step 2: Destroying color converters...");
+  DestroyColorConverters();
+
+  // Step 3: Destroy all buffers
+  Log("[NET] Step 3: Destroying buffers...");
   for (auto& [id, buffer] : connected_buffers_) {
     if (buffer) {
       try {
@@ -301,8 +364,8 @@ void CameraManager::DisconnectAllCameras() {
   }
   connected_buffers_.clear();
 
-  // Step 3: Destroy all acquisition devices LAST
-  Log("[NET] Step 3: Destroying devices...");
+  // Step 4: Destroy all acquisition devices LAST
+  Log("[NET] Step 4: Destroying devices...");
   for (auto& [id, device] : connected_devices_) {
     if (device) {
       try {
@@ -696,73 +759,36 @@ bool CameraManager::CaptureCamera(const std::string& cameraId, const std::string
         }
       } else {
         // Perform color conversion before saving
-        SapColorConversion colorConv(buffer);
+        // Reuse this buffer's converter (and its output buffer) across frames
+        SapColorConversion* colorConv = AcquireColorConverter(buffer);
+        if (!colorConv) {
+          return false;
+        }
 
         try {
-          if (!colorConv.Enable(TRUE, color_config_.use_hardware)) {
-            Log("[ERR] ❌ Failed to enable color conversion");
-            return false;
-          }
-          if (!colorConv.Create()) {
-            Log("[ERR] ❌ Failed to create color converter");
-            return false;
-          }
-
-          // Output format mapping
-          if (color_config_.color_output_format == std::string("RGB888")) {
-            colorConv.SetOutputFormat(SapFormatRGB888);
-          } else if (color_config_.color_output_format == std::string("RGB8888")) {
-            colorConv.SetOutputFormat(SapFormatRGB8888);
-          } else if (color_config_.color_output_format == std::string("RGB101010")) {
-            colorConv.SetOutputFormat(SapFormatRGB101010);
-          } else {
-            colorConv.SetOutputFormat(SapFormatRGB888);
-          }
-
-          // Bayer align
-          SapColorConversion::Align align = SapColorConversion::AlignRGGB;
-          switch (color_config_.bayer_align) {
-            case 0: align = SapColorConversion::AlignGBRG; break;
-            case 1: align = SapColorConversion::AlignBGGR; break;
-            case 2: align = SapColorConversion::AlignRGGB; break;
-            case 3: align = SapColorConversion::AlignGRBG; break;
-            case 4: align = SapColorConversion::AlignRGBG; break;
-            case 5: align = SapColorConversion::AlignBGRG; break;
-          }
-          colorConv.SetAlign(align);
-
-          // Method
-          SapColorConversion::Method method = SapColorConversion::Method1;
-          switch (color_config_.color_method) {
-            case 1: method = SapColorConversion::Method1; break;
-            case 2: method = SapColorConversion::Method2; break;
-            case 3: method = SapColorConversion::Method3; break;
-            case 4: method = SapColorConversion::Method4; break;
-            case 5: method = SapColorConversion::Method5; break;
-            case 6: method = SapColorConversion::Method6; break;
-            case 7: method = SapColorConversion::Method7; break;
-          }
-          colorConv.SetMethod(method);
+          colorConv->SetOutputFormat(ColorOutputFormatFromName(color_config_.color_output_format));
+          colorConv->SetAlign(BayerAlignFromIndex(color_config_.bayer_align));
+          colorConv->SetMethod(ColorMethodFromIndex(color_config_.color_method));
 
           // WB gain/offset and gamma
           SapDataFRGB wbGain(color_config_.wb_gain_r, color_config_.wb_gain_g, color_config_.wb_gain_b);
-          colorConv.SetWBGain(wbGain);
+          colorConv->SetWBGain(wbGain);
           SapDataFRGB wbOff(color_config_.wb_offset_r, color_config_.wb_offset_g, color_config_.wb_offset_b);
-          colorConv.SetWBOffset(wbOff);
-          colorConv.SetGamma(color_config_.gamma);
+          colorConv->SetWBOffset(wbOff);
+          colorConv->SetGamma(color_config_.gamma);
 
           // Convert
-          if (!colorConv.Convert()) {
+          if (!colorConv->Convert()) {
             Log("[ERR] ❌ Color conversion failed");
-            colorConv.Destroy();
+            ReleaseColorConverter(buffer);
             return false;
           }
 
           // Save converted buffer as TIFF
-          SapBuffer* outBuf = colorConv.GetOutputBuffer();
+          SapBuffer* outBuf = colorConv->GetOutputBuffer();
           if (!outBuf) {
             Log("[ERR] ❌ No output buffer from color converter");
-            colorConv.Destroy();
+            ReleaseColorConverter(buffer);
             return false;
           }
 
@@ -771,16 +797,12 @@ bool CameraManager::CaptureCamera(const std::string& cameraId, const std::string
             saveOk = outBuf->Save(fullPath.c_str(), "-format tiff");
           } catch (const std::exception& e) {
             Log("[ERR] ❌ Exception saving TIFF: " + std::string(e.what()));
-            colorConv.Destroy();
             return false;
           } catch (...) {
             Log("[ERR] ❌ Unknown exception saving TIFF");
-            colorConv.Destroy();
             return false;
           }
 
-          colorConv.Destroy();
-
           if (saveOk) {
             Log("[OK] ✅ TIFF image saved with color conversion: " + filename);
             return true;
@@ -791,11 +813,11 @@ bool CameraManager::CaptureCamera(const std::string& cameraId, const std::string
 
         } catch (const std::exception& e) {
           Log("[ERR] ❌ Exception during color conversion: " + std::string(e.what()));
-          try { colorConv.Destroy(); } catch (...) {}
+          ReleaseColorConverter(buffer);
           return false;
         } catch (...) {
           Log("[ERR] ❌ Unknown exception during color conversion");
-          try { colorConv.Destroy(); } catch (...) {}
+          ReleaseColorConverter(buffer);
           return false;
         }
       }
@@ -817,6 +839,57 @@ bool CameraManager::CaptureCamera(const std::string& cameraId, const std::string
   }
 }
 
+SapColorConversion* CameraManager::AcquireColorConverter(SapBuffer* buffer) {
+  std::lock_guard<std::mutex> lock(color_converters_mutex_);
+
+  auto it = color_converters_.find(buffer);
+  if (it != color_converters_.end()) {
+    if (it->second.use_hardware == color_config_.use_hardware) {
+      return it->second.converter;
+    }
+    // Hardware/software mode changed - recreate the converter
+    try { it->second.converter->Destroy(); } catch (...) {}
+    delete it->second.converter;
+    color_converters_.erase(it);
+  }
+
+  auto* converter = new SapColorConversion(buffer);
+  if (!converter->Enable(TRUE, color_config_.use_hardware)) {
+    Log("[ERR] ❌ Failed to enable color conversion");
+    delete converter;
+    return nullptr;
+  }
+  if (!converter->Create()) {
+    Log("[ERR] ❌ Failed to create color converter");
+    delete converter;
+    return nullptr;
+  }
+
+  color_converters_[buffer] = {converter, color_config_.use_hardware};
+  return converter;
+}
+
+void CameraManager::ReleaseColorConverter(SapBuffer* buffer) {
+  std::lock_guard<std::mutex> lock(color_converters_mutex_);
+
+  auto it = color_converters_.find(buffer);
+  if (it == color_converters_.end()) return;
+
+  try { it->second.converter->Destroy(); } catch (...) {}
+  delete it->second.converter;
+  color_converters_.erase(it);
+}
+
+void CameraManager::DestroyColorConverters() {
+  std::lock_guard<std::mutex> lock(color_converters_mutex_);
+
+  for (auto& [buffer, cached] : color_converters_) {
+    try { cached.converter->Destroy(); } catch (...) {}
+    delete cached.converter;
+  }
+  color_converters_.clear();
+}
+
 bool CameraManager::SaveImageFromBuffer(SapBuffer* buffer, const std::string& fullPath, const std::string& cameraName) {
   try {
     // Null check
@@ -850,73 +923,36 @@ bool CameraManager::SaveImageFromBuffer(SapBuffer* buffer, const std::string& fu
       }
     } else {
       // Perform color conversion before saving
-      SapColorConversion colorConv(buffer);
+      // Reuse this buffer's converter (and its output buffer) across frames
+      SapColorConversion* colorConv = AcquireColorConverter(buffer);
+      if (!colorConv) {
+        return false;
+      }
 
       try {
-        if (!colorConv.Enable(TRUE, color_config_.use_hardware)) {
-          Log("[ERR] ❌ Failed to enable color conversion");
-          return false;
-        }
-        if (!colorConv.Create()) {
-          Log("[ERR] ❌ Failed to create color converter");
-          return false;
-        }
-
-        // Output format mapping
-        if (color_config_.color_output_format == std::string("RGB888")) {
-          colorConv.SetOutputFormat(SapFormatRGB888);
-        } else if (color_config_.color_output_format == std::string("RGB8888")) {
-          colorConv.SetOutputFormat(SapFormatRGB8888);
-        } else if (color_config_.color_output_format == std::string("RGB101010")) {
-          colorConv.SetOutputFormat(SapFormatRGB101010);
-        } else {
-          colorConv.SetOutputFormat(SapFormatRGB888);
-        }
-
-        // Bayer align
-        SapColorConversion::Align align = SapColorConversion::AlignRGGB;
-        switch (color_config_.bayer_align) {
-          case 0: align = SapColorConversion::AlignGBRG; break;
-          case 1: align = SapColorConversion::AlignBGGR; break;
-          case 2: align = SapColorConversion::AlignRGGB; break;
-          case 3: align = SapColorConversion::AlignGRBG; break;
-          case 4: align = SapColorConversion::AlignRGBG; break;
-          case 5: align = SapColorConversion::AlignBGRG; break;
-        }
-        colorConv.SetAlign(align);
-
-        // Method
-        SapColorConversion::Method method = SapColorConversion::Method1;
-        switch (color_config_.color_method) {
-          case 1: method = SapColorConversion::Method1; break;
-          case 2: method = SapColorConversion::Method2; break;
-          case 3: method = SapColorConversion::Method3; break;
-          case 4: method = SapColorConversion::Method4; break;
-          case 5: method = SapColorConversion::Method5; break;
-          case 6: method = SapColorConversion::Method6; break;
-          case 7: method = SapColorConversion::Method7; break;
-        }
-        colorConv.SetMethod(method);
+        colorConv->SetOutputFormat(ColorOutputFormatFromName(color_config_.color_output_format));
+        colorConv->SetAlign(BayerAlignFromIndex(color_config_.bayer_align));
+        colorConv->SetMethod(ColorMethodFromIndex(color_config_.color_method));
 
         // WB gain/offset and gamma
         SapDataFRGB wbGain(color_config_.wb_gain_r, color_config_.wb_gain_g, color_config_.wb_gain_b);
-        colorConv.SetWBGain(wbGain);
+        colorConv->SetWBGain(wbGain);
         SapDataFRGB wbOff(color_config_.wb_offset_r, color_config_.wb_offset_g, color_config_.wb_offset_b);
-        colorConv.SetWBOffset(wbOff);
-        colorConv.SetGamma(color_config_.gamma);
+        colorConv->SetWBOffset(wbOff);
+        colorConv->SetGamma(color_config_.gamma);
 
         // Convert
-        if (!colorConv.Convert()) {
+        if (!colorConv->Convert()) {
           Log("[ERR] ❌ Color conversion failed");
-          colorConv.Destroy();
+          ReleaseColorConverter(buffer);
           return false;
         }
 
         // Save converted buffer as TIFF
-        SapBuffer* outBuf = colorConv.GetOutputBuffer();
+        SapBuffer* outBuf = colorConv->GetOutputBuffer();
         if (!outBuf) {
           Log("[ERR] ❌ No output buffer from color converter");
-          colorConv.Destroy();
+          ReleaseColorConverter(buffer);
           return false;
         }
 
@@ -925,16 +961,12 @@ bool CameraManager::SaveImageFromBuffer(SapBuffer* buffer, const std::string& fu
           saveOk = outBuf->Save(fullPath.c_str(), "-format tiff");
         } catch (const std::exception& e) {
           Log("[ERR] ❌ Exception saving TIFF: " + std::string(e.what()));
-          colorConv.Destroy();
           return false;
         } catch (...) {
           Log("[ERR] ❌ Unknown exception saving TIFF");
-          colorConv.Destroy();
           return false;
         }
 
-        colorConv.Destroy();
-
         if (saveOk) {
           Log("[OK] ✅ TIFF image saved with color conversion: " + fullPath);
           return true;
@@ -945,11 +977,11 @@ bool CameraManager::SaveImageFromBuffer(SapBuffer* buffer, const std::string& fu
 
       } catch (const std::exception& e) {
         Log("[ERR] ❌ Exception during color conversion: " + std::string(e.what()));
-        try { colorConv.Destroy(); } catch (...) {}
+        ReleaseColorConverter(buffer);
         return false;
       } catch (...) {
         Log("[ERR] ❌ Unknown exception during color conversion");
-        try { colorConv.Destroy(); } catch (...) {}
+        ReleaseColorConverter(buffer);
         return false;
       }
     }